@@ -4,172 +4,13 @@ Convert DOCX files to JSON format for direct loading by JavaScript.
 """
 
 import os
-import re
-import json
 from pathlib import Path
-from docx import Document
 from datetime import datetime
 
-def extract_date_from_filename(filename):
-    """Extract date from filename for sorting and display."""
-    month_map = {
-        'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
-        'may': '05', 'jun': '06', 'jul': '07', 
-        'aug': '08', 'august': '08',
-        'sep': '09', 'sept': '09', 'september': '09',
-        'oct': '10', 'october': '10',
-        'nov': '11', 'november': '11',
-        'dec': '12', 'december': '12'
-    }
-    
-    date_pattern = r'(jan|feb|mar|apr|may|jun|jul|aug|august|sep|sept|september|oct|october|nov|november|dec|december)\s+(\d+)'
-    match = re.search(date_pattern, filename.lower())
-    
-    if match:
-        month_abbr = match.group(1)
-        day = match.group(2).zfill(2)
-        month_num = month_map.get(month_abbr, '12')
-        return f"2025-{month_num}-{day}"
-    
-    return "2025-01-01"
-
-def parse_filename_for_metadata(filename):
-    """Parse filename to extract candidate, location, and other metadata."""
-    name_without_ext = filename.replace('.docx', '')
-    
-    # Handle different filename patterns
-    if name_without_ext.startswith(('Oct ', 'Sep ', 'Sept ', 'Aug ', 'Jul ', 'Jun ', 'May ', 'Apr ', 'Mar ', 'Feb ', 'Jan ', 'Dec ', 'Nov ')):
-        parts = name_without_ext.split(' - ', 1)
-        if len(parts) == 2:
-            date_part = parts[0]
-            name_part = parts[1]
-            
-            # Parse the name part
-            name_parts = name_part.split('_')
-            if len(name_parts) >= 2:
-                candidate = name_parts[0]
-                location = '_'.join(name_parts[1:-1]) if len(name_parts) > 2 else name_parts[1]
-                return candidate, location, date_part
-            else:
-                # Handle case where there are no underscores
-                if 'sherrill' in name_part.lower():
-                    candidate = 'Sherrill'
-                elif 'ciattarelli' in name_part.lower():
-                    candidate = 'Ciattarelli'
-                else:
-                    candidate = 'Unknown'
-                
-                location = name_part.replace(candidate, '').strip()
-                return candidate, location, date_part
-    elif name_without_ext.startswith(('August ', 'September ', 'October ')):
-        parts = name_without_ext.split(' - ', 1)
-        if len(parts) == 2:
-            date_part = parts[0]
-            name_part = parts[1]
-            
-            if 'sherrill' in name_part.lower():
-                candidate = 'Sherrill'
-            elif 'ciattarelli' in name_part.lower():
-                candidate = 'Ciattarelli'
-            else:
-                candidate = 'Unknown'
-            
-            location = name_part.replace(candidate, '').strip()
-            return candidate, location, date_part
-    else:
-        # Format: "Candidate_Location_Date.docx" or other patterns
-        parts = name_without_ext.split('_')
-        if len(parts) >= 2:
-            candidate = parts[0]
-            location = '_'.join(parts[1:-1]) if len(parts) > 2 else parts[1]
-            return candidate, location, "Unknown"
-    
-    # Fallback - try to extract candidate name and date from filename
-    if 'sherrill' in filename.lower():
-        candidate = 'Sherrill'
-    elif 'ciattarelli' in filename.lower():
-        candidate = 'Ciattarelli'
-    else:
-        candidate = 'Unknown'
-    
-    # Try to extract date from filename
-    date_match = re.search(r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+(\d+)', name_without_ext.lower())
-    if date_match:
-        date_part = f"{date_match.group(1).title()} {date_match.group(2)}"
-    else:
-        date_part = "Unknown"
-    
-    # Extract location/title from filename
-    location = name_without_ext.replace(candidate, '').strip('_').strip('-').strip()
-    
-    return candidate, location, date_part
-
-def extract_youtube_url(text):
-    """Extract YouTube URL from text if present."""
-    if not text:
-        return ""
-    
-    youtube_patterns = [
-        r'https?://(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})',
-        r'https?://youtu\.be/([a-zA-Z0-9_-]{11})',
-        r'https?://(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})',
-        r'https?://(?:www\.)?youtube\.com/v/([a-zA-Z0-9_-]{11})'
-    ]
-    
-    for pattern in youtube_patterns:
-        match = re.search(pattern, text)
-        if match:
-            return match.group(0)
-    
-    return ""
-
-def extract_text_from_docx(file_path):
-    """Extract all text from a .docx file."""
-    try:
-        doc = Document(file_path)
-        text_parts = []
-        
-        # Extract text from paragraphs
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                text_parts.append(paragraph.text.strip())
-        
-        return "\n\n".join(text_parts)
-    except Exception as e:
-        print(f"Error reading {file_path}: {str(e)}")
-        return ""
-
-def clean_text_for_analysis(text):
-    """Clean text for better analysis."""
-    if not text:
-        return ""
-    
-    # Remove YouTube URLs from text
-    youtube_patterns = [
-        r'https?://(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})',
-        r'https?://youtu\.be/([a-zA-Z0-9_-]{11})',
-        r'https?://(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})',
-        r'https?://(?:www\.)?youtube\.com/v/([a-zA-Z0-9_-]{11})'
-    ]
-    
-    for pattern in youtube_patterns:
-        text = re.sub(pattern, '', text)
-    
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Remove HTML entities
-    text = text.replace('&#39;', "'")
-    text = text.replace('&quot;', '"')
-    text = text.replace('&amp;', '&')
-    text = text.replace('&lt;', '<')
-    text = text.replace('&gt;', '>')
-    
-    # Remove common transcript artifacts
-    text = re.sub(r'\[.*?\]', '', text)  # Remove [laughter], [applause], etc.
-    text = re.sub(r'\(.*?\)', '', text)  # Remove (inaudible), etc.
-    
-    return text.strip()
+from docx_text import extract_text_from_docx
+from filename_meta import extract_date_from_filename, parse_filename_for_metadata
+from json_io import dump_file
+from text_clean import clean_text_for_analysis, extract_youtube_url
 
 def process_docx_files(directory_path):
     """Process all .docx files in the directory and return data."""
@@ -209,7 +50,7 @@ def process_docx_files(directory_path):
             text_content = extract_text_from_docx(docx_file)
             
             # Extract YouTube URL from text
-            youtube_url = extract_youtube_url(text_content)
+            youtube_url, youtube_id = extract_youtube_url(text_content)
             
             # Clean text for analysis
             cleaned_text = clean_text_for_analysis(text_content)
@@ -221,7 +62,7 @@ def process_docx_files(directory_path):
                 'location_or_title': location,
                 'transcript_text': cleaned_text,
                 'youtubeUrl': youtube_url,
-                'youtubeId': youtube_url.split('v=')[1].split('&')[0] if youtube_url and 'v=' in youtube_url else ''
+                'youtubeId': youtube_id
             })
             
             print(f"  Candidate: {candidate}")
@@ -246,8 +87,7 @@ def main():
     if transcripts:
         # Save to JSON file
         output_file = 'transcripts.json'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(transcripts, f, indent=2, ensure_ascii=False)
+        dump_file(transcripts, output_file)
         
         print(f"\n✅ JSON file created successfully: {output_file}")
         print(f"📊 Total records: {len(transcripts)}")
@@ -9,10 +9,20 @@ Creates Word documents with header: Date - Candidate - Location
 
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from docx import Document
 from docx.shared import Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from file_scan import scan_files
+
+# Month abbreviations indexed by month number
+_MONTH_ABBR = ('Unknown', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+               'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# HTML entities left behind by the transcript downloader, decoded in one pass
+_ENTITIES = {'&#39;': "'", '&quot;': '"'}
+_ENT_RE = re.compile('|'.join(map(re.escape, _ENTITIES)))
 
 def parse_filename(filename):
     """
@@ -37,11 +47,7 @@ def parse_filename(filename):
             year = date[4:]
             
             # Convert month number to abbreviation
-            month_abbr = {
-                1: 'Jan', 2: 'Feb', 3: 'Mar', 4: 'Apr',
-                5: 'May', 6: 'Jun', 7: 'Jul', 8: 'Aug',
-                9: 'Sep', 10: 'Oct', 11: 'Nov', 12: 'Dec'
-            }.get(month_num, 'Unknown')
+            month_abbr = _MONTH_ABBR[month_num] if 1 <= month_num <= 12 else 'Unknown'
             
             formatted_date = f"{month_abbr} {day}"
         else:
@@ -63,8 +69,7 @@ def remove_line_breaks(text):
     text = re.sub(r'\s+', ' ', text)
     
     # Clean up HTML entities
-    text = text.replace('&#39;', "'")
-    text = text.replace('&quot;', '"')
+    text = _ENT_RE.sub(lambda m: _ENTITIES[m.group(0)], text)
     
     return text.strip()
 
@@ -103,6 +108,37 @@ def create_word_document(candidate, location, date, content, base_filename, outp
     doc.save(str(output_filename))
     print(f"Created: {output_filename}")
 
+def _convert_one(txt_path, output_dir):
+    """
+    Convert a single .txt transcript to a Word document.
+    Runs in a worker process, so it returns a status tuple instead of raising.
+    
+    Returns:
+        (name, ok, err) where err is an error message or None
+    """
+    txt_file = Path(txt_path)
+    
+    try:
+        # Parse filename
+        candidate, location, date = parse_filename(txt_file.name)
+        
+        # Read file content
+        with open(txt_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        # Remove line breaks
+        cleaned_content = remove_line_breaks(content)
+        
+        # Create base filename (without date prefix)
+        base_filename = txt_file.with_suffix('.docx').name
+        
+        # Create Word document (will overwrite if exists)
+        create_word_document(candidate, location, date, cleaned_content, base_filename, output_dir)
+        
+        return txt_file.name, True, None
+    except Exception as e:
+        return txt_file.name, False, str(e)
+
 def process_text_files(directory_path, output_dir):
     """
     Process all .txt files in the specified directory.
@@ -118,7 +154,7 @@ def process_text_files(directory_path, output_dir):
         return
     
     # Find all .txt files (excluding requirements.txt)
-    txt_files = [f for f in directory.glob("*.txt") if f.name != "requirements.txt"]
+    txt_files = [e for e in scan_files(directory, ".txt") if e.name != "requirements.txt"]
     
     if not txt_files:
         print(f"No .txt files found in {directory_path}")
@@ -127,31 +163,16 @@ def process_text_files(directory_path, output_dir):
     print(f"Found {len(txt_files)} text files to process:")
     print(f"Output directory: {output_dir}")
     
-    for txt_file in txt_files:
-        print(f"\nProcessing: {txt_file.name}")
+    # Each file is independent, so convert them across worker processes
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [executor.submit(_convert_one, txt_file.path, output_dir) for txt_file in txt_files]
         
-        try:
-            # Parse filename
-            candidate, location, date = parse_filename(txt_file.name)
-            print(f"  Candidate: {candidate}")
-            print(f"  Location: {location}")
-            print(f"  Date: {date}")
-            
-            # Read file content
-            with open(txt_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Remove line breaks
-            cleaned_content = remove_line_breaks(content)
-            
-            # Create base filename (without date prefix)
-            base_filename = txt_file.with_suffix('.docx').name
-            
-            # Create Word document (will overwrite if exists)
-            create_word_document(candidate, location, date, cleaned_content, base_filename, output_dir)
-            
-        except Exception as e:
-            print(f"  Error processing {txt_file.name}: {str(e)}")
+        for future in as_completed(futures):
+            name, ok, err = future.result()
+            if ok:
+                print(f"  Processed: {name}")
+            else:
+                print(f"  Error processing {name}: {err}")
 
 def main():
     """
@@ -5,22 +5,58 @@ Reads Word documents, separates by candidate name, and combines them into single
 
 import os
 import re
+import sys
 from pathlib import Path
 from docx import Document
 from docx.shared import Inches
 
+# The DOCX reader and directory listing are shared with the scripts in the parent directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from docx_text import iter_docx_paragraphs
+from file_scan import scan_files
+
+# Month abbreviations mapped to month numbers
+_MONTH_MAP = {
+    'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
+    'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
+    'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
+}
+
+# Precompiled date pattern used for sorting files
+_DATE_RE = re.compile(r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+(\d+)')
+
+# Splits paragraph text into plain runs and the tab/break characters between them
+_RUN_SPLIT_RE = re.compile(r'([\t\r\n])')
+
 def convert_to_sentence_case(text):
     """
     Convert text to sentence case if it's all caps.
     """
+    # Text without any uppercase letters can't be all caps
+    if not any(map(str.isupper, text)):
+        return text
+    
     # Check if text is all caps (ignoring punctuation and spaces)
     words = text.split()
     if not words:
         return text
     
-    # Count words that are all caps
-    caps_words = sum(1 for word in words if word.isupper() and word.isalpha())
-    total_words = sum(1 for word in words if word.isalpha())
+    # Count all-caps words and other alphabetic words in one pass, stopping
+    # as soon as the remaining words can no longer push caps above 80%
+    caps_words = 0
+    other_words = 0
+    remaining = len(words)
+    for word in words:
+        remaining -= 1
+        if word.isalpha():
+            if word.isupper():
+                caps_words += 1
+            else:
+                other_words += 1
+                if caps_words + remaining <= 4 * other_words:
+                    return text
+    
+    total_words = caps_words + other_words
     
     # If more than 80% of words are all caps, convert to sentence case
     if total_words > 0 and caps_words / total_words > 0.8:
@@ -31,9 +67,7 @@ def convert_to_sentence_case(text):
         for sentence in sentences:
             if sentence.strip():
                 # Convert first letter to uppercase, rest to lowercase
-                sentence = sentence.strip()
-                if sentence:
-                    sentence = sentence[0].upper() + sentence[1:].lower()
+                sentence = sentence.strip().capitalize()
                 converted_sentences.append(sentence)
         
         return '. '.join(converted_sentences)
@@ -46,13 +80,12 @@ def read_docx_text(file_path):
     Equivalent to the read_docx_text function in R.
     """
     try:
-        doc = Document(file_path)
         text_parts = []
         
         # Extract text from paragraphs
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():  # Only add non-empty paragraphs
-                text = paragraph.text.strip()
+        for paragraph_text in iter_docx_paragraphs(file_path):
+            if paragraph_text.strip():  # Only add non-empty paragraphs
+                text = paragraph_text.strip()
                 # Convert to sentence case if needed
                 text = convert_to_sentence_case(text)
                 text_parts.append(text)
@@ -67,24 +100,13 @@ def extract_date_from_filename(filename):
     Extract date from filename for sorting.
     Looks for patterns like "Oct 2", "Sep 29", "Aug 28", etc.
     """
-    import re
-    from datetime import datetime
-    
-    # Month abbreviations mapping
-    month_map = {
-        'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
-        'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
-        'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
-    }
-    
     # Look for date patterns like "Oct 2", "Sep 29", "Aug 28"
-    date_pattern = r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+(\d+)'
-    match = re.search(date_pattern, filename.lower())
+    match = _DATE_RE.search(filename.lower())
     
     if match:
         month_abbr = match.group(1)
         day = match.group(2).zfill(2)
-        month_num = month_map.get(month_abbr, '12')
+        month_num = _MONTH_MAP.get(month_abbr, '12')
         # Assume current year (2025) for sorting
         return f"2025-{month_num}-{day}"
     
@@ -119,13 +141,30 @@ def combine_text_from_files(file_list, separator="\n\n-----\n\n"):
     """
     combined_texts = []
     
-    for file_path in file_list:
-        text = read_docx_text(file_path)
+    for file in file_list:
+        text = read_docx_text(file)
         if text:  # Only add non-empty text
             combined_texts.append(text)
     
     return separator.join(combined_texts)
 
+def add_text_paragraph(doc, text):
+    """
+    Append a paragraph containing text to the document.
+    Produces the same XML as doc.add_paragraph(text), but writes each
+    stretch of text as one <w:t> instead of feeding python-docx's
+    run builder one character at a time.
+    """
+    r = doc.add_paragraph()._p.add_r()
+    
+    for piece in _RUN_SPLIT_RE.split(text):
+        if piece == '\t':
+            r.add_tab()
+        elif piece in ('\r', '\n'):
+            r.add_br()
+        elif piece:
+            r.add_t(piece)
+
 def create_combined_document(text_content, base_filename):
     """
     Create a new Word document with combined text.
@@ -147,7 +186,7 @@ def create_combined_document(text_content, base_filename):
                     doc.add_heading(f"File {i+1}", level=2)
                 
                 # Add the paragraph content
-                para = doc.add_paragraph(paragraph_text)
+                add_text_paragraph(doc, paragraph_text)
         
         # Add today's date to filename
         today = datetime.now()
@@ -170,7 +209,7 @@ def main():
     print(f"Working directory: {working_dir}")
     
     # List all .docx files in the folder (equivalent to list.files() in R)
-    docx_files = list(working_dir.glob("*.docx"))
+    docx_files = scan_files(working_dir, ".docx")
     # Exclude temporary files, requirements, output files, and NJ Governors Forum docs
     docx_files = [f for f in docx_files if not f.name.startswith("~$") 
                   and f.name != "requirements.docx"
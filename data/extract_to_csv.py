@@ -7,62 +7,123 @@ Processes .docx files and extracts: date, candidate, location/title, transcript
 import os
 import re
 import csv
+import sys
+from collections import deque
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from docx import Document
 from datetime import datetime
 
+# The DOCX reader and directory listing are shared with the scripts in the parent directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from docx_text import iter_docx_paragraphs
+from file_scan import scan_files
+
+# Month names and abbreviations mapped to month numbers
+_MONTH_MAP = {
+    'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
+    'may': '05', 'jun': '06', 'jul': '07', 
+    'aug': '08', 'august': '08',
+    'sep': '09', 'sept': '09', 'september': '09',
+    'oct': '10', 'october': '10',
+    'nov': '11', 'november': '11',
+    'dec': '12', 'december': '12'
+}
+
+# Precompiled patterns shared across all files in a batch
+_DATE_RE = re.compile(r'(jan|feb|mar|apr|may|jun|jul|aug|august|sep|sept|september|oct|october|nov|november|dec|december)\s+(\d+)')
+_SHORT_DATE_RE = re.compile(r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+(\d+)')
+# Matches watch, youtu.be, embed and /v/ links in one pass; group 1 is the video ID
+_YT_RE = re.compile(r'https?://(?:(?:www\.)?youtube\.com/(?:watch\?v=|embed/|v/)|youtu\.be/)([a-zA-Z0-9_-]{11})')
+# Leading "<Month> <day> - <rest>" in a filename; "short" is set for abbreviated months,
+# "day" when the month is followed by a day number, and "rest" is unset when there
+# is no " - " separator
+_FNAME_RE = re.compile(
+    r'^(?P<date>(?P<month>(?P<short>Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)|August|September|October)'
+    r'(?= )(?:\s+(?P<day>\d+))?.*?)'
+    r'(?: - (?P<rest>.*))?$',
+    re.DOTALL
+)
+_WS_RE = re.compile(r'\s+')
+_BRACKET_RE = re.compile(r'\[.*?\]')
+_PAREN_RE = re.compile(r'\(.*?\)')
+_CTRL_RE = re.compile(r'[\x00-\x1f\x7f-\x9f]')
+
+# Characters that could break CSV structure, scrubbed in a single translate pass
+_CSV_SCRUB = str.maketrans({'"': "'", '\n': ' ', '\r': ' ', '\t': ' '})
+
+# HTML entities decoded in a single pass over the text
+_ENTITIES = {'&#39;': "'", '&quot;': '"', '&amp;': '&', '&lt;': '<', '&gt;': '>'}
+_ENT_RE = re.compile('|'.join(map(re.escape, _ENTITIES)))
+
+@dataclass
+class FileMeta:
+    """
+    Metadata parsed from a transcript filename.
+    sort_date is searched in the whole filename and only orders the files;
+    iso_date, the CSV date, comes from display_date as in convert_docx_to_json.py.
+    """
+    sort_date: str
+    iso_date: str
+    candidate: str
+    location: str
+    display_date: str
+
+def _iso_date(month, day):
+    """ISO date in 2025 for a lowercase month name or abbreviation and a day number."""
+    return f"2025-{_MONTH_MAP[month]}-{day.zfill(2)}"
+
 def extract_date_from_filename(filename):
     """
     Extract date from filename for sorting and CSV.
     Looks for patterns like "Oct 2", "Sep 29", "Aug 28", etc.
     """
-    # Month abbreviations mapping
-    month_map = {
-        'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
-        'may': '05', 'jun': '06', 'jul': '07', 
-        'aug': '08', 'august': '08',
-        'sep': '09', 'sept': '09', 'september': '09',
-        'oct': '10', 'october': '10',
-        'nov': '11', 'november': '11',
-        'dec': '12', 'december': '12'
-    }
-    
     # Look for date patterns like "Oct 2", "Sep 29", "Aug 28", "August 21", "September 5"
-    date_pattern = r'(jan|feb|mar|apr|may|jun|jul|aug|august|sep|sept|september|oct|october|nov|november|dec|december)\s+(\d+)'
-    match = re.search(date_pattern, filename.lower())
+    match = _DATE_RE.search(filename.lower())
     
     if match:
         month_abbr = match.group(1)
         day = match.group(2).zfill(2)
-        month_num = month_map.get(month_abbr, '12')
+        month_num = _MONTH_MAP.get(month_abbr, '12')
         # Assume current year (2025) for sorting
         return f"2025-{month_num}-{day}"
     
     # If no date found, return a very early date for sorting
     return "2025-01-01"
 
-def parse_filename_for_metadata(filename):
+def parse_filename(filename):
     """
-    Parse filename to extract candidate, location, and other metadata.
-    Handles various filename formats.
+    Parse a filename once into all the metadata needed for sorting and the CSV row.
+    Handles various filename formats. For "<Month> <day> ..." names both dates
+    come from the one _FNAME_RE match; other names fall back to _DATE_RE.
     """
     # Remove .docx extension
     name_without_ext = filename.replace('.docx', '')
     
     # Handle different filename patterns
-    if name_without_ext.startswith(('Oct ', 'Sep ', 'Sept ', 'Aug ', 'Jul ', 'Jun ', 'May ', 'Apr ', 'Mar ', 'Feb ', 'Jan ', 'Dec ', 'Nov ')):
-        # Format: "Oct 3 - Candidate_Location_Date.docx"
-        parts = name_without_ext.split(' - ', 1)
-        if len(parts) == 2:
-            date_part = parts[0]
-            name_part = parts[1]
+    match = _FNAME_RE.match(name_without_ext)
+    prefix_date = None
+    if match and match.group('day') is not None:
+        prefix_date = _iso_date(match.group('month').lower(), match.group('day'))
+    if prefix_date and filename.startswith(name_without_ext[:match.end('day')]):
+        # The leading month and day are the first date _DATE_RE would find
+        sort_date = prefix_date
+    else:
+        sort_date = extract_date_from_filename(filename)
+    
+    if match:
+        # Format: "Oct 3 - Candidate_Location_Date.docx" or "August 21 - Sherrill speech on energy.docx"
+        if match.group('rest') is not None:
+            date_part = match.group('date')
+            name_part = match.group('rest')
+            iso_date = prefix_date or extract_date_from_filename(date_part)
             
-            # Parse the name part
+            # Parse the name part (only abbreviated-month names use underscores)
             name_parts = name_part.split('_')
-            if len(name_parts) >= 2:
+            if match.group('short') and len(name_parts) >= 2:
                 candidate = name_parts[0]
                 location = '_'.join(name_parts[1:-1]) if len(name_parts) > 2 else name_parts[1]
-                return candidate, location, date_part
+                return FileMeta(sort_date, iso_date, candidate, location, date_part)
             else:
                 # Handle case where there are no underscores (e.g., "Sherrill appearance on Democracy Docket")
                 # Extract candidate from name part
@@ -75,32 +136,14 @@ def parse_filename_for_metadata(filename):
                 
                 # Location is the rest of the name part
                 location = name_part.replace(candidate, '').strip()
-                return candidate, location, date_part
-    elif name_without_ext.startswith(('August ', 'September ', 'October ')):
-        # Format: "August 21 - Sherrill speech on energy.docx"
-        parts = name_without_ext.split(' - ', 1)
-        if len(parts) == 2:
-            date_part = parts[0]
-            name_part = parts[1]
-            
-            # Extract candidate from name part
-            if 'sherrill' in name_part.lower():
-                candidate = 'Sherrill'
-            elif 'ciattarelli' in name_part.lower():
-                candidate = 'Ciattarelli'
-            else:
-                candidate = 'Unknown'
-            
-            # Location is the rest of the name part
-            location = name_part.replace(candidate, '').strip()
-            return candidate, location, date_part
+                return FileMeta(sort_date, iso_date, candidate, location, date_part)
     else:
         # Format: "Candidate_Location_Date.docx" or other patterns
         parts = name_without_ext.split('_')
         if len(parts) >= 2:
             candidate = parts[0]
             location = '_'.join(parts[1:-1]) if len(parts) > 2 else parts[1]
-            return candidate, location, "Unknown"
+            return FileMeta(sort_date, "2025-01-01", candidate, location, "Unknown")
     
     # Fallback - try to extract candidate name and date from filename
     if 'sherrill' in filename.lower():
@@ -111,124 +154,139 @@ def parse_filename_for_metadata(filename):
         candidate = 'Unknown'
     
     # Try to extract date from filename
-    date_match = re.search(r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+(\d+)', name_without_ext.lower())
+    date_match = _SHORT_DATE_RE.search(name_without_ext.lower())
     if date_match:
         date_part = f"{date_match.group(1).title()} {date_match.group(2)}"
+        iso_date = _iso_date(date_match.group(1), date_match.group(2))
     else:
         date_part = "Unknown"
+        iso_date = "2025-01-01"
     
     # Extract location/title from filename
     location = name_without_ext.replace(candidate, '').strip('_').strip('-').strip()
     
-    return candidate, location, date_part
-
-def convert_date_to_iso(date_str):
-    """
-    Convert date string to ISO format (YYYY-MM-DD) for 2025.
-    Handles formats like "Oct 3", "Sep 29", "Aug 28", etc.
-    """
-    if date_str == "Unknown":
-        return "2025-01-01"  # Default date
-    
-    # Month abbreviations mapping
-    month_map = {
-        'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
-        'may': '05', 'jun': '06', 'jul': '07', 
-        'aug': '08', 'august': '08',
-        'sep': '09', 'sept': '09', 'september': '09',
-        'oct': '10', 'october': '10',
-        'nov': '11', 'november': '11',
-        'dec': '12', 'december': '12'
-    }
-    
-    # Look for date patterns like "Oct 3", "Sep 29", "Aug 28", "August 21", "September 5"
-    date_pattern = r'(jan|feb|mar|apr|may|jun|jul|aug|august|sep|sept|september|oct|october|nov|november|dec|december)\s+(\d+)'
-    match = re.search(date_pattern, date_str.lower())
-    
-    if match:
-        month_abbr = match.group(1)
-        day = match.group(2).zfill(2)
-        month_num = month_map.get(month_abbr, '01')
-        return f"2025-{month_num}-{day}"
-    
-    return "2025-01-01"  # Default if parsing fails
+    return FileMeta(sort_date, iso_date, candidate, location, date_part)
 
 def extract_text_from_docx(file_path):
     """
     Extract all text from a .docx file.
     """
     try:
-        doc = Document(file_path)
         text_parts = []
         
         # Extract text from paragraphs
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():  # Only add non-empty paragraphs
-                text_parts.append(paragraph.text.strip())
+        for paragraph_text in iter_docx_paragraphs(file_path):
+            if paragraph_text.strip():  # Only add non-empty paragraphs
+                text_parts.append(paragraph_text.strip())
         
         return "\n\n".join(text_parts)
     except Exception as e:
         print(f"Error reading {file_path}: {str(e)}")
         return ""
 
-def extract_youtube_url(text):
+def split_youtube_url(text):
     """
-    Extract YouTube URL from text if present.
-    Returns the URL if found, empty string otherwise.
+    Extract the YouTube URL from text and remove all YouTube URLs in the same pass.
+    Returns (url, text_without_urls); url is an empty string if none was found.
     """
     if not text:
-        return ""
+        return "", text
     
-    # YouTube URL patterns
-    youtube_patterns = [
-        r'https?://(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})',
-        r'https?://youtu\.be/([a-zA-Z0-9_-]{11})',
-        r'https?://(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})',
-        r'https?://(?:www\.)?youtube\.com/v/([a-zA-Z0-9_-]{11})'
-    ]
+    found = []
     
-    for pattern in youtube_patterns:
-        match = re.search(pattern, text)
-        if match:
-            # Return the full URL, not just the video ID
-            return match.group(0)
+    def _remove(match):
+        # Keep the first full URL, not just the video ID
+        if not found:
+            found.append(match.group(0))
+        return ''
     
-    return ""
+    text = _YT_RE.sub(_remove, text)
+    return (found[0] if found else ""), text
 
 def clean_text_for_analysis(text):
     """
     Clean text for better analysis.
+    YouTube URLs are expected to have been removed by split_youtube_url.
     """
     if not text:
         return ""
     
-    # Remove YouTube URLs from text
-    youtube_patterns = [
-        r'https?://(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})',
-        r'https?://youtu\.be/([a-zA-Z0-9_-]{11})',
-        r'https?://(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})',
-        r'https?://(?:www\.)?youtube\.com/v/([a-zA-Z0-9_-]{11})'
-    ]
-    
-    for pattern in youtube_patterns:
-        text = re.sub(pattern, '', text)
-    
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WS_RE.sub(' ', text)
     
     # Remove HTML entities
-    text = text.replace('&#39;', "'")
-    text = text.replace('&quot;', '"')
-    text = text.replace('&amp;', '&')
-    text = text.replace('&lt;', '<')
-    text = text.replace('&gt;', '>')
+    text = _ENT_RE.sub(lambda m: _ENTITIES[m.group(0)], text)
     
     # Remove common transcript artifacts
-    text = re.sub(r'\[.*?\]', '', text)  # Remove [laughter], [applause], etc.
-    text = re.sub(r'\(.*?\)', '', text)  # Remove (inaudible), etc.
+    text = _BRACKET_RE.sub('', text)  # Remove [laughter], [applause], etc.
+    text = _PAREN_RE.sub('', text)  # Remove (inaudible), etc.
     
     return text.strip()
 
+def _normalize_csv_field(value):
+    """
+    Replace characters that could break CSV structure in a field.
+    Applied exactly once per field when the row is built.
+    """
+    # Replace quotes with single quotes and line breaks/tabs with spaces
+    value = value.translate(_CSV_SCRUB)
+    # Remove any remaining control characters
+    value = _CTRL_RE.sub('', value)
+    # Clean up multiple spaces
+    return _WS_RE.sub(' ', value).strip()
+
+def _extract_one(path_str, meta):
+    """
+    Extract one .docx file into a CSV-ready row tuple using its parsed filename metadata.
+    Runs in a worker thread, so it returns a status tuple instead of raising.
+    
+    Returns:
+        (row, err) where err is an error message or None
+    """
+    try:
+        # Extract text content
+        text_content = extract_text_from_docx(path_str)
+        
+        # Extract YouTube URL and remove it from the text in one pass
+        youtube_url, text_content = split_youtube_url(text_content)
+        
+        # Clean text for analysis
+        cleaned_text = clean_text_for_analysis(text_content)
+        
+        # Fields in CSV column order
+        row = (
+            _normalize_csv_field(meta.iso_date),
+            _normalize_csv_field(meta.candidate),
+            _normalize_csv_field(meta.location),
+            _normalize_csv_field(cleaned_text),
+            _normalize_csv_field(youtube_url)
+        )
+        return row, None
+    except Exception as e:
+        return None, str(e)
+
+def _iter_extracted(parsed_files, max_workers=16):
+    """
+    Yield (meta, docx_file, row, err) for each parsed file, in input order.
+    Only a bounded window of documents is in flight at once, so memory use
+    doesn't grow with the number of files.
+    """
+    # Reading many small zips is dominated by file I/O and zlib, both of which
+    # release the GIL, so threads overlap the reads without pickling results
+    # back from worker processes
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        
+        for meta, docx_file in parsed_files:
+            pending.append((meta, docx_file, executor.submit(_extract_one, docx_file.path, meta)))
+            if len(pending) >= 2 * max_workers:
+                meta, docx_file, future = pending.popleft()
+                yield (meta, docx_file, *future.result())
+        
+        while pending:
+            meta, docx_file, future = pending.popleft()
+            yield (meta, docx_file, *future.result())
+
 def process_docx_files(directory_path, output_csv):
     """
     Process all .docx files in the directory and create CSV.
@@ -240,7 +298,7 @@ def process_docx_files(directory_path, output_csv):
         return
     
     # Find all .docx files (excluding output files and temp files)
-    docx_files = [f for f in directory.glob("*.docx") 
+    docx_files = [f for f in scan_files(directory, ".docx")
                   if not f.name.startswith("~$") 
                   and not f.name.startswith("Combined_")
                   and f.name != "requirements.docx"]
@@ -251,106 +309,70 @@ def process_docx_files(directory_path, output_csv):
     
     print(f"Found {len(docx_files)} Word documents to process:")
     
-    # Sort files by date for consistent output
-    docx_files.sort(key=lambda x: extract_date_from_filename(x.name))
+    # Parse each filename once, then sort by date for consistent output
+    parsed_files = sorted(((parse_filename(f.name), f) for f in docx_files),
+                          key=lambda t: t[0].sort_date)
     
-    # Prepare CSV data
-    csv_data = []
+    # Running totals for the summary, so rows can be written as they are produced
+    total_records = 0
+    total_words = 0
+    candidate_counts = {}
+    youtube_rows = []
     
-    for docx_file in docx_files:
-        print(f"\nProcessing: {docx_file.name}")
+    fieldnames = ['date', 'candidate', 'location_or_title', 'transcript_text', 'youtubeUrl']
+    
+    with open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile, quoting=csv.QUOTE_ALL)
         
-        try:
-            # Parse filename for metadata
-            candidate, location, date = parse_filename_for_metadata(docx_file.name)
-            
-            # Convert date to ISO format
-            iso_date = convert_date_to_iso(date)
-            
-            # Extract text content
-            text_content = extract_text_from_docx(docx_file)
+        # Write header
+        writer.writerow(fieldnames)
+        
+        for meta, docx_file, row, err in _iter_extracted(parsed_files):
+            print(f"\nProcessing: {docx_file.name}")
             
-            # Extract YouTube URL from text
-            youtube_url = extract_youtube_url(text_content)
+            if err is not None:
+                print(f"  Error processing {docx_file.name}: {err}")
+                continue
             
-            # Clean text for analysis
-            cleaned_text = clean_text_for_analysis(text_content)
+            # Write the row as soon as it is ready
+            writer.writerow(row)
             
-            # Add to CSV data
-            csv_data.append({
-                'date': iso_date,
-                'candidate': candidate,
-                'location_or_title': location,
-                'transcript_text': cleaned_text,
-                'youtubeUrl': youtube_url
-            })
+            cleaned_text, youtube_url = row[3], row[4]
+            # Whitespace is already collapsed to single spaces, so count separators
+            word_count = cleaned_text.count(' ') + 1 if cleaned_text else 0
+            total_records += 1
+            total_words += word_count
+            candidate_counts[meta.candidate] = candidate_counts.get(meta.candidate, 0) + 1
+            if youtube_url:
+                youtube_rows.append((meta.candidate, meta.location, youtube_url))
             
-            print(f"  Candidate: {candidate}")
-            print(f"  Location/Title: {location}")
-            print(f"  Date: {date}")
-            print(f"  Word count: {len(cleaned_text.split()) if cleaned_text else 0}")
+            print(f"  Candidate: {meta.candidate}")
+            print(f"  Location/Title: {meta.location}")
+            print(f"  Date: {meta.display_date}")
+            print(f"  Word count: {word_count}")
             if youtube_url:
                 print(f"  YouTube URL: {youtube_url}")
-            
-        except Exception as e:
-            print(f"  Error processing {docx_file.name}: {str(e)}")
     
-    # Write to CSV
-    if csv_data:
-        with open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['date', 'candidate', 'location_or_title', 'transcript_text', 'youtubeUrl']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames, quoting=csv.QUOTE_ALL)
-            
-            # Write header
-            writer.writeheader()
-            
-            # Write data
-            for row in csv_data:
-                # Clean the transcript text to handle commas and special characters
-                cleaned_row = row.copy()
-                if 'transcript_text' in cleaned_row:
-                    # Replace problematic characters that could break CSV parsing
-                    cleaned_row['transcript_text'] = cleaned_row['transcript_text'].replace('\n', ' ').replace('\r', ' ')
-                    # Remove any remaining control characters
-                    cleaned_row['transcript_text'] = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', cleaned_row['transcript_text'])
-                    # Replace problematic characters that could break CSV structure
-                    cleaned_row['transcript_text'] = cleaned_row['transcript_text'].replace('"', "'")  # Replace quotes with single quotes
-                    cleaned_row['transcript_text'] = cleaned_row['transcript_text'].replace('\t', ' ')  # Replace tabs with spaces
-                    # Clean up multiple spaces
-                    cleaned_row['transcript_text'] = re.sub(r'\s+', ' ', cleaned_row['transcript_text']).strip()
-                
-                # Clean other fields too
-                for key, value in cleaned_row.items():
-                    if isinstance(value, str):
-                        cleaned_row[key] = value.replace('"', "'").replace('\n', ' ').replace('\r', ' ').replace('\t', ' ')
-                        cleaned_row[key] = re.sub(r'\s+', ' ', cleaned_row[key]).strip()
-                
-                writer.writerow(cleaned_row)
-        
+    if total_records:
         print(f"\n✅ CSV created successfully: {output_csv}")
-        print(f"📊 Total records: {len(csv_data)}")
-        print(f"📝 Total words: {sum(len(row['transcript_text'].split()) for row in csv_data):,}")
+        print(f"📊 Total records: {total_records}")
+        print(f"📝 Total words: {total_words:,}")
         
         # Show summary by candidate
-        candidate_counts = {}
-        for row in csv_data:
-            candidate = row['candidate']
-            candidate_counts[candidate] = candidate_counts.get(candidate, 0) + 1
-        
         print(f"\n📈 Records by candidate:")
         for candidate, count in sorted(candidate_counts.items()):
             print(f"  {candidate}: {count} records")
         
         # Show YouTube URL summary
-        youtube_count = sum(1 for row in csv_data if row['youtubeUrl'])
-        print(f"\n🎥 Records with YouTube URLs: {youtube_count}")
-        if youtube_count > 0:
+        print(f"\n🎥 Records with YouTube URLs: {len(youtube_rows)}")
+        if youtube_rows:
             print("  YouTube URLs found:")
-            for row in csv_data:
-                if row['youtubeUrl']:
-                    print(f"    {row['candidate']} - {row['location_or_title']}: {row['youtubeUrl']}")
+            for candidate, location, youtube_url in youtube_rows:
+                print(f"    {candidate} - {location}: {youtube_url}")
     
     else:
+        # Nothing was extracted, so don't leave a header-only file behind
+        os.remove(output_csv)
         print("No data to write to CSV")
 
 def main():
@@ -5,185 +5,101 @@ This replaces the CSV approach with direct DOCX file parsing.
 """
 
 import os
-import re
-import json
+import gzip
+import logging
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from docx import Document
 from datetime import datetime
 from flask import Flask, jsonify, request
 from flask_cors import CORS
 
+from docx_text import extract_text_from_docx
+from filename_meta import extract_date_from_filename, parse_filename_for_metadata
+from json_io import dumps_sorted
+from text_clean import clean_text_for_analysis, extract_youtube_url
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
 
-def extract_date_from_filename(filename):
-    """Extract date from filename for sorting and display."""
-    month_map = {
-        'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
-        'may': '05', 'jun': '06', 'jul': '07', 
-        'aug': '08', 'august': '08',
-        'sep': '09', 'sept': '09', 'september': '09',
-        'oct': '10', 'october': '10',
-        'nov': '11', 'november': '11',
-        'dec': '12', 'december': '12'
-    }
-    
-    # Look for date patterns like "Oct 2", "Sep 29", "Aug 28", "August 21", "September 5"
-    date_pattern = r'(jan|feb|mar|apr|may|jun|jul|aug|august|sep|sept|september|oct|october|nov|november|dec|december)\s+(\d+)'
-    match = re.search(date_pattern, filename.lower())
-    
-    if match:
-        month_abbr = match.group(1)
-        day = match.group(2).zfill(2)
-        month_num = month_map.get(month_abbr, '12')
-        return f"2025-{month_num}-{day}"
-    
-    return "2025-01-01"
+logger = logging.getLogger(__name__)
 
-def parse_filename_for_metadata(filename):
-    """Parse filename to extract candidate, location, and other metadata."""
-    name_without_ext = filename.replace('.docx', '')
-    
-    # Handle different filename patterns
-    if name_without_ext.startswith(('Oct ', 'Sep ', 'Sept ', 'Aug ', 'Jul ', 'Jun ', 'May ', 'Apr ', 'Mar ', 'Feb ', 'Jan ', 'Dec ', 'Nov ')):
-        parts = name_without_ext.split(' - ', 1)
-        if len(parts) == 2:
-            date_part = parts[0]
-            name_part = parts[1]
-            
-            # Parse the name part
-            name_parts = name_part.split('_')
-            if len(name_parts) >= 2:
-                candidate = name_parts[0]
-                location = '_'.join(name_parts[1:-1]) if len(name_parts) > 2 else name_parts[1]
-                return candidate, location, date_part
-            else:
-                # Handle case where there are no underscores
-                if 'sherrill' in name_part.lower():
-                    candidate = 'Sherrill'
-                elif 'ciattarelli' in name_part.lower():
-                    candidate = 'Ciattarelli'
-                else:
-                    candidate = 'Unknown'
-                
-                location = name_part.replace(candidate, '').strip()
-                return candidate, location, date_part
-    elif name_without_ext.startswith(('August ', 'September ', 'October ')):
-        parts = name_without_ext.split(' - ', 1)
-        if len(parts) == 2:
-            date_part = parts[0]
-            name_part = parts[1]
-            
-            if 'sherrill' in name_part.lower():
-                candidate = 'Sherrill'
-            elif 'ciattarelli' in name_part.lower():
-                candidate = 'Ciattarelli'
-            else:
-                candidate = 'Unknown'
-            
-            location = name_part.replace(candidate, '').strip()
-            return candidate, location, date_part
-    else:
-        # Format: "Candidate_Location_Date.docx" or other patterns
-        parts = name_without_ext.split('_')
-        if len(parts) >= 2:
-            candidate = parts[0]
-            location = '_'.join(parts[1:-1]) if len(parts) > 2 else parts[1]
-            return candidate, location, "Unknown"
-    
-    # Fallback - try to extract candidate name and date from filename
-    if 'sherrill' in filename.lower():
-        candidate = 'Sherrill'
-    elif 'ciattarelli' in filename.lower():
-        candidate = 'Ciattarelli'
-    else:
-        candidate = 'Unknown'
-    
-    # Try to extract date from filename
-    date_match = re.search(r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+(\d+)', name_without_ext.lower())
-    if date_match:
-        date_part = f"{date_match.group(1).title()} {date_match.group(2)}"
-    else:
-        date_part = "Unknown"
-    
-    # Extract location/title from filename
-    location = name_without_ext.replace(candidate, '').strip('_').strip('-').strip()
-    
-    return candidate, location, date_part
+# Parsed transcripts are cached next to the DOCX files, keyed by file name and
+# validated by (mtime_ns, size). Bump the version when the parsing output changes.
+_CACHE_NAME = '.transcripts_cache.pkl'
+_CACHE_VERSION = 3
 
-def extract_youtube_url(text):
-    """Extract YouTube URL from text if present."""
-    if not text:
-        return ""
+def _process_one(path_str):
+    """
+    Parse a single .docx transcript into its transcript record.
+    Runs in a worker process, so it returns a status tuple instead of raising.
+    
+    Returns:
+        (name, date, word_count, transcript, err) where date is the date as
+        written in the filename, and transcript is None and err is an error
+        message if the file could not be processed
+    """
+    docx_file = Path(path_str)
+    date = None
+    word_count = 0
     
-    youtube_patterns = [
-        r'https?://(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})',
-        r'https?://youtu\.be/([a-zA-Z0-9_-]{11})',
-        r'https?://(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})',
-        r'https?://(?:www\.)?youtube\.com/v/([a-zA-Z0-9_-]{11})'
-    ]
-    
-    for pattern in youtube_patterns:
-        match = re.search(pattern, text)
-        if match:
-            return match.group(0)
-    
-    return ""
-
-def extract_text_from_docx(file_path):
-    """Extract all text from a .docx file."""
     try:
-        doc = Document(file_path)
-        text_parts = []
+        # Parse filename for metadata
+        candidate, location, date = parse_filename_for_metadata(docx_file.name)
         
-        # Extract text from paragraphs
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                text_parts.append(paragraph.text.strip())
+        # Convert date to ISO format
+        iso_date = extract_date_from_filename(date)
         
-        return "\n\n".join(text_parts)
+        # Extract text content
+        text_content = extract_text_from_docx(docx_file)
+        
+        # Extract YouTube URL from text
+        youtube_url, youtube_id = extract_youtube_url(text_content)
+        
+        # Clean text for analysis
+        cleaned_text = clean_text_for_analysis(text_content)
+        
+        # Counted here so the word count is cached along with the record
+        word_count = len(cleaned_text.split())
+        
+        return docx_file.name, date, word_count, {
+            'date': iso_date,
+            'candidate': candidate,
+            'location_or_title': location,
+            'transcript_text': cleaned_text,
+            'youtubeUrl': youtube_url,
+            'youtubeId': youtube_id
+        }, None
     except Exception as e:
-        print(f"Error reading {file_path}: {str(e)}")
-        return ""
+        return docx_file.name, date, word_count, None, str(e)
 
-def clean_text_for_analysis(text):
-    """Clean text for better analysis."""
-    if not text:
-        return ""
-    
-    # Remove YouTube URLs from text
-    youtube_patterns = [
-        r'https?://(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})',
-        r'https?://youtu\.be/([a-zA-Z0-9_-]{11})',
-        r'https?://(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})',
-        r'https?://(?:www\.)?youtube\.com/v/([a-zA-Z0-9_-]{11})'
-    ]
-    
-    for pattern in youtube_patterns:
-        text = re.sub(pattern, '', text)
-    
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Remove HTML entities
-    text = text.replace('&#39;', "'")
-    text = text.replace('&quot;', '"')
-    text = text.replace('&amp;', '&')
-    text = text.replace('&lt;', '<')
-    text = text.replace('&gt;', '>')
-    
-    # Remove common transcript artifacts
-    text = re.sub(r'\[.*?\]', '', text)  # Remove [laughter], [applause], etc.
-    text = re.sub(r'\(.*?\)', '', text)  # Remove (inaudible), etc.
-    
-    return text.strip()
+def _load_cache(cache_path):
+    """Load the parsed-transcript cache, or an empty one if it is missing or stale."""
+    try:
+        with open(cache_path, 'rb') as f:
+            version, entries = pickle.load(f)
+        if version == _CACHE_VERSION:
+            return entries
+    except Exception:
+        pass
+    return {}
+
+def _save_cache(cache_path, entries):
+    """Write the parsed-transcript cache, replacing the old file atomically."""
+    tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((_CACHE_VERSION, entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning("Could not write cache %s: %s", cache_path, e)
 
 def process_docx_files(directory_path):
     """Process all .docx files in the directory and return data."""
     directory = Path(directory_path)
     
     if not directory.exists():
-        print(f"Directory {directory_path} does not exist!")
+        logger.warning("Directory %s does not exist!", directory_path)
         return []
     
     # Find all .docx files (excluding temp files)
@@ -191,71 +107,97 @@ def process_docx_files(directory_path):
                   if not f.name.startswith("~$")]
     
     if not docx_files:
-        print(f"No .docx files found in {directory_path}")
+        logger.warning("No .docx files found in %s", directory_path)
         return []
     
-    print(f"Found {len(docx_files)} Word documents to process")
+    logger.info("Found %d Word documents to process", len(docx_files))
     
     # Sort files by date for consistent output
     docx_files.sort(key=lambda x: extract_date_from_filename(x.name))
     
-    # Process files
+    # Reuse cached results for files whose mtime and size are unchanged
+    cache_path = directory / _CACHE_NAME
+    cache = _load_cache(cache_path)
+    new_cache = {}
+    parsed = {}
+    stale = []
+    
+    for docx_file in docx_files:
+        st = docx_file.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        entry = cache.get(docx_file.name)
+        if entry is not None and entry[0] == key:
+            parsed[docx_file.name] = entry[1]
+            new_cache[docx_file.name] = entry
+        else:
+            stale.append((docx_file, key))
+    
+    # Each changed file is independent, so parse them across worker processes
+    if stale:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(_process_one, [str(f) for f, _ in stale], chunksize=4)
+            
+            for (_, key), (name, date, word_count, transcript, err) in zip(stale, results):
+                parsed[name] = (date, word_count, transcript, err)
+                if err is None:
+                    new_cache[name] = (key, parsed[name])
+    
+    if stale or len(new_cache) != len(cache):
+        _save_cache(cache_path, new_cache)
+    
+    # Report and collect in the sorted file order. One INFO line per file; the
+    # per-field details are only formatted when DEBUG logging is enabled.
     transcripts = []
+    debug = logger.isEnabledFor(logging.DEBUG)
     
     for docx_file in docx_files:
-        print(f"Processing: {docx_file.name}")
+        name = docx_file.name
+        date, word_count, transcript, err = parsed[name]
         
-        try:
-            # Parse filename for metadata
-            candidate, location, date = parse_filename_for_metadata(docx_file.name)
-            
-            # Convert date to ISO format
-            iso_date = extract_date_from_filename(date)
-            
-            # Extract text content
-            text_content = extract_text_from_docx(docx_file)
-            
-            # Extract YouTube URL from text
-            youtube_url = extract_youtube_url(text_content)
-            
-            # Clean text for analysis
-            cleaned_text = clean_text_for_analysis(text_content)
-            
-            # Add to transcripts
-            transcripts.append({
-                'date': iso_date,
-                'candidate': candidate,
-                'location_or_title': location,
-                'transcript_text': cleaned_text,
-                'youtubeUrl': youtube_url,
-                'youtubeId': youtube_url.split('v=')[1].split('&')[0] if youtube_url and 'v=' in youtube_url else ''
-            })
-            
-            print(f"  Candidate: {candidate}")
-            print(f"  Location/Title: {location}")
-            print(f"  Date: {date}")
-            print(f"  Word count: {len(cleaned_text.split()) if cleaned_text else 0}")
-            if youtube_url:
-                print(f"  YouTube URL: {youtube_url}")
-            
-        except Exception as e:
-            print(f"  Error processing {docx_file.name}: {str(e)}")
+        if err is not None:
+            logger.error("Error processing %s: %s", name, err)
+            continue
+        
+        transcripts.append(transcript)
+        
+        logger.info("%s -> %s/%s words=%d", name, transcript['candidate'],
+                    transcript['location_or_title'], word_count)
+        if debug:
+            logger.debug("  Date: %s", date)
+            if transcript['youtubeUrl']:
+                logger.debug("  YouTube URL: %s", transcript['youtubeUrl'])
     
     return transcripts
 
-# Global variable to store processed transcripts
+# Global variables to store processed transcripts and their serialized response
+# bodies, plain and gzip-compressed
 transcripts_data = []
+transcripts_json = b'[]'
+transcripts_json_gz = gzip.compress(transcripts_json)
+
+def set_transcripts(transcripts):
+    """Replace the served transcripts and prebuild their JSON response bodies."""
+    global transcripts_data, transcripts_json, transcripts_json_gz
+    transcripts_data = transcripts
+    transcripts_json = dumps_sorted(transcripts)
+    transcripts_json_gz = gzip.compress(transcripts_json, compresslevel=6)
 
 @app.route('/api/transcripts', methods=['GET'])
 def get_transcripts():
     """API endpoint to get all transcripts."""
-    return jsonify(transcripts_data)
+    # Serialized and compressed once per load, not once per request
+    if request.accept_encodings['gzip']:
+        response = app.response_class(transcripts_json_gz, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = app.response_class(transcripts_json, mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+    return response
 
 @app.route('/api/transcripts/reload', methods=['POST'])
 def reload_transcripts():
     """API endpoint to reload transcripts from DOCX files."""
-    global transcripts_data
-    transcripts_data = process_docx_files('data')
+    set_transcripts(process_docx_files('data'))
     return jsonify({
         'message': f'Reloaded {len(transcripts_data)} transcripts',
         'count': len(transcripts_data)
@@ -267,9 +209,11 @@ def health_check():
     return jsonify({'status': 'healthy', 'transcripts_loaded': len(transcripts_data)})
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     # Process transcripts on startup
     print("Processing DOCX files...")
-    transcripts_data = process_docx_files('data')
+    set_transcripts(process_docx_files('data'))
     print(f"Loaded {len(transcripts_data)} transcripts")
     
     # Start Flask server
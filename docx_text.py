@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Shared text extraction for transcript DOCX files.
+Used by docx_parser.py, convert_docx_to_json.py, generate_ngram_frequencies.py
+and the scripts in data/.
+"""
+
+import zipfile
+
+from lxml import etree
+
+# WordprocessingML namespace, as it prefixes every tag in word/document.xml
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+# Run children that python-docx renders as text. w:t contributes its own text and
+# w:br a newline for text-wrapping breaks only; the rest map to a fixed character.
+_RUN_TEXT_TAGS = (_W + 't', _W + 'tab', _W + 'br', _W + 'cr', _W + 'noBreakHyphen', _W + 'ptab')
+_RUN_CHARS = {_W + 'tab': '\t', _W + 'cr': '\n', _W + 'noBreakHyphen': '-', _W + 'ptab': '\t'}
+
+def _is_body_paragraph(el):
+    """True if el is a w:p directly inside w:body."""
+    return el.tag == _W + 'p' and el.getparent().tag == _W + 'body'
+
+def iter_docx_paragraphs(file_path):
+    """
+    Yield the text of each body paragraph in a .docx file.
+    Streams word/document.xml straight out of the zip instead of building
+    a python-docx Document, since only the text is needed.
+    
+    Matches python-docx's Paragraph.text: only runs that are direct children of
+    a body-level w:p, or of a w:hyperlink in one, contribute. Paragraphs nested
+    in text boxes or tables, and runs inside w:ins, w:fldSimple and the like,
+    neither add text nor end the enclosing paragraph.
+    """
+    with zipfile.ZipFile(file_path) as z, z.open('word/document.xml') as f:
+        parts = []
+        for _, el in etree.iterparse(f, tag=_RUN_TEXT_TAGS + (_W + 'p',)):
+            if el.tag == _W + 'p':
+                if _is_body_paragraph(el):
+                    yield ''.join(parts)
+                    parts = []
+                el.clear()
+                continue
+            
+            run = el.getparent()
+            if run.tag != _W + 'r':
+                continue
+            container = run.getparent()
+            if container.tag == _W + 'hyperlink':
+                container = container.getparent()
+            if not _is_body_paragraph(container):
+                continue
+            
+            if el.tag == _W + 't':
+                parts.append(el.text or '')
+            elif el.tag == _W + 'br':
+                # Page and column breaks have no text equivalent
+                if el.get(_W + 'type', 'textWrapping') == 'textWrapping':
+                    parts.append('\n')
+            else:
+                parts.append(_RUN_CHARS[el.tag])
+
+def extract_text_from_docx(file_path):
+    """
+    Extract all text from a .docx file.
+    Read errors propagate, so each caller reports the file and skips it instead
+    of keeping an empty transcript.
+    """
+    text_parts = []
+    
+    # Extract text from paragraphs
+    for paragraph_text in iter_docx_paragraphs(file_path):
+        if paragraph_text.strip():
+            text_parts.append(paragraph_text.strip())
+    
+    return "\n\n".join(text_parts)
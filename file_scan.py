@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Shared directory listing for the conversion scripts.
+Used by convert_to_word.py and the scripts in data/.
+"""
+
+import os
+
+def scan_files(directory, suffix):
+    """
+    List regular files in a directory whose names end with the given suffix.
+    Uses os.scandir so the file type comes from the cached DirEntry.
+    """
+    with os.scandir(directory) as it:
+        return [e for e in it if e.is_file() and e.name.endswith(suffix)]
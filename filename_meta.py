@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Shared filename parsing for transcript DOCX files.
+Used by docx_parser.py, convert_docx_to_json.py and generate_ngram_frequencies.py.
+"""
+
+import re
+
+# Month names and abbreviations mapped to month numbers
+_MONTH_MAP = {
+    'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
+    'may': '05', 'jun': '06', 'jul': '07',
+    'aug': '08', 'august': '08',
+    'sep': '09', 'sept': '09', 'september': '09',
+    'oct': '10', 'october': '10',
+    'nov': '11', 'november': '11',
+    'dec': '12', 'december': '12'
+}
+
+# Month names are written as a prefix trie so the engine rejects a position after
+# a character or two instead of retrying each of the 18 alternatives
+_DATE_RE = re.compile(r'(jan|feb|ma[ry]|apr|ju[nl]|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\s+(\d+)')
+_SHORT_DATE_RE = re.compile(r'(jan|feb|ma[ry]|apr|ju[nl]|aug|sep|oct|nov|dec)\s+(\d+)')
+
+# Leading "<Month> <day> - <rest>" in a filename; "short" is set for abbreviated months
+# and "rest" is unset when there is no " - " separator
+_FNAME_RE = re.compile(
+    r'^(?P<date>(?:(?P<short>Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)|August|September|October)(?= ).*?)'
+    r'(?: - (?P<rest>.*))?$',
+    re.DOTALL
+)
+
+def extract_date_from_filename(filename):
+    """Extract date from filename for sorting and display."""
+    # Look for date patterns like "Oct 2", "Sep 29", "Aug 28", "August 21", "September 5"
+    match = _DATE_RE.search(filename.lower())
+    
+    if match:
+        month_abbr = match.group(1)
+        day = match.group(2).zfill(2)
+        month_num = _MONTH_MAP.get(month_abbr, '12')
+        return f"2025-{month_num}-{day}"
+    
+    return "2025-01-01"
+
+def _guess_candidate(low):
+    """Guess the candidate from an already-lowercased piece of a filename."""
+    if 'sherrill' in low:
+        return 'Sherrill'
+    if 'ciattarelli' in low:
+        return 'Ciattarelli'
+    return 'Unknown'
+
+def parse_filename_for_metadata(filename):
+    """Parse filename to extract candidate, location, and other metadata."""
+    name_without_ext = filename.replace('.docx', '')
+    
+    # Handle different filename patterns
+    match = _FNAME_RE.match(name_without_ext)
+    if match:
+        # Format: "Oct 3 - Candidate_Location_Date" or "August 21 - Sherrill speech on energy"
+        if match.group('rest') is not None:
+            date_part = match.group('date')
+            name_part = match.group('rest')
+    
+            # Parse the name part (only abbreviated-month names use underscores)
+            name_parts = name_part.split('_')
+            if match.group('short') and len(name_parts) >= 2:
+                candidate = name_parts[0]
+                location = '_'.join(name_parts[1:-1]) if len(name_parts) > 2 else name_parts[1]
+                return candidate, location, date_part
+            else:
+                # Handle case where there are no underscores
+                candidate = _guess_candidate(name_part.lower())
+    
+                location = name_part.replace(candidate, '').strip()
+                return candidate, location, date_part
+    else:
+        # Format: "Candidate_Location_Date.docx" or other patterns
+        parts = name_without_ext.split('_')
+        if len(parts) >= 2:
+            candidate = parts[0]
+            location = '_'.join(parts[1:-1]) if len(parts) > 2 else parts[1]
+            return candidate, location, "Unknown"
+    
+    # Fallback - try to extract candidate name and date from filename
+    candidate = _guess_candidate(filename.lower())
+    
+    # Try to extract date from filename
+    date_match = _SHORT_DATE_RE.search(name_without_ext.lower())
+    if date_match:
+        date_part = f"{date_match.group(1).title()} {date_match.group(2)}"
+    else:
+        date_part = "Unknown"
+    
+    # Extract location/title from filename
+    location = name_without_ext.replace(candidate, '').strip('_').strip('-').strip()
+    
+    return candidate, location, date_part
@@ -23,22 +23,38 @@ Usage examples:
     python3 generate_ngram_frequencies.py --output my_ngrams.csv
 """
 
-import json
 import csv
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from datetime import datetime, timedelta
+import datetime as dt
 from collections import defaultdict, Counter
-from typing import List, Dict, Tuple, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, List, Dict, Tuple, Optional
+
+from filename_meta import extract_date_from_filename, parse_filename_for_metadata
+from json_io import load_file
+from text_clean import clean_text
 
 try:
-    from docx import Document
+    from docx_text import extract_text_from_docx
     HAS_DOCX = True
 except ImportError:
     HAS_DOCX = False
-    print("Warning: python-docx not installed. Will only work with transcripts.json")
+    print("Warning: lxml not installed. Will only work with transcripts.json")
+
+
+# Column order of the rows returned by generate_ngram_frequencies
+FIELDNAMES = ['week', 'candidate', 'term', 'count', 'total_words', 'normalized_freq', 'ngram_type']
 
+# Precompiled patterns, compiled once at import instead of looked up on every call
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_ISO_DATE_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
 
+
+@lru_cache(maxsize=None)
 def get_week_start(date_str: str) -> str:
     """Get the Sunday of the week for a given date.
     
@@ -49,88 +65,96 @@ def get_week_start(date_str: str) -> str:
         Date string for Sunday of that week (YYYY-MM-DD)
     """
     try:
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-        # Get Sunday of the week (Sunday = 6, Monday = 0)
+        # Slice plain YYYY-MM-DD strings directly; strptime is only needed for
+        # the looser forms it also accepts, such as unpadded months and days
+        if _ISO_DATE_RE.fullmatch(date_str):
+            date_obj = dt.date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+        else:
+            date_obj = dt.datetime.strptime(date_str, "%Y-%m-%d").date()
         # weekday() returns 0-6 where Monday=0, so Sunday=6
-        weekday = date_obj.weekday()  # 0=Monday, 6=Sunday
         # Convert to Sunday-based: Sunday=0, Monday=1, ..., Saturday=6
-        days_since_sunday = (weekday + 1) % 7
-        sunday = date_obj - timedelta(days=days_since_sunday)
-        return sunday.strftime("%Y-%m-%d")
+        days_since_sunday = (date_obj.weekday() + 1) % 7
+        return dt.date.fromordinal(date_obj.toordinal() - days_since_sunday).isoformat()
     except ValueError:
         return date_str
 
 
-def clean_text(text: str) -> str:
-    """Clean text for ngram extraction."""
-    if not text:
-        return ""
-    
-    # Remove YouTube URLs
-    youtube_patterns = [
-        r'https?://(?:www\.)?youtube\.com/watch\?v=[^\s]+',
-        r'https?://youtu\.be/[^\s]+',
-        r'https?://(?:www\.)?youtube\.com/embed/[^\s]+',
-    ]
-    for pattern in youtube_patterns:
-        text = re.sub(pattern, '', text)
-    
-    # Remove brackets and parentheses content (e.g., [laughter], (inaudible))
-    text = re.sub(r'\[.*?\]', '', text)
-    text = re.sub(r'\(.*?\)', '', text)
-    
-    # Remove HTML entities
-    text = text.replace('&#39;', "'")
-    text = text.replace('&quot;', '"')
-    text = text.replace('&amp;', '&')
-    
-    # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text)
-    
-    return text.strip()
-
-
-def extract_ngrams(text: str, n: int) -> List[str]:
-    """Extract n-grams from text.
+def tokenize(text: str) -> List[str]:
+    """Lowercase, clean and split text into words for ngram extraction.
     
     Args:
         text: Input text
-        n: Size of n-gram (1, 2, or 3)
         
     Returns:
-        List of n-gram strings
+        List of words
     """
     # Clean and tokenize
     text = clean_text(text.lower())
     
     # Remove punctuation but keep spaces for word boundaries
-    text = re.sub(r'[^\w\s]', ' ', text)
+    text = _PUNCT_RE.sub(' ', text)
     
-    # Split into words and filter out empty strings
-    words = [w.strip() for w in text.split() if w.strip()]
+    # split() with no arguments already drops empty strings
+    return text.split()
+
+
+def extract_ngrams(words: List[str], n: int) -> Iterable[str]:
+    """Extract n-grams from a tokenized text.
     
-    if len(words) < n:
-        return []
+    Args:
+        words: List of words from tokenize()
+        n: Size of n-gram (1, 2, or 3)
+        
+    Returns:
+        Iterable of n-gram strings, suitable for feeding straight into a Counter
+    """
+    if n == 1:
+        return words
     
-    # Generate n-grams
-    ngrams = []
-    for i in range(len(words) - n + 1):
-        ngram = ' '.join(words[i:i+n])
-        ngrams.append(ngram)
+    # Pair each word with its successors via zip instead of slicing and
+    # joining a new list for every position
+    if n == 2:
+        return (a + ' ' + b for a, b in zip(words, islice(words, 1, None)))
     
-    return ngrams
+    if n == 3:
+        return (a + ' ' + b + ' ' + c
+                for a, b, c in zip(words, islice(words, 1, None), islice(words, 2, None)))
+    
+    return (' '.join(words[i:i+n]) for i in range(len(words) - n + 1))
 
 
 def load_transcripts_from_json(json_path: str) -> List[Dict]:
     """Load transcripts from JSON file."""
-    with open(json_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return load_file(json_path)
+
+
+def _load_one(path_str: str) -> Tuple[str, Optional[Dict], Optional[str]]:
+    """Load one DOCX transcript in a worker process.
+    
+    Returns:
+        (name, transcript, err) where transcript is None and err is an error
+        message if the file could not be processed
+    """
+    docx_file = Path(path_str)
+    try:
+        candidate, location, date = parse_filename_for_metadata(docx_file.name)
+        iso_date = extract_date_from_filename(date)
+        text_content = extract_text_from_docx(docx_file)
+        
+        return docx_file.name, {
+            'date': iso_date,
+            'candidate': candidate,
+            'location_or_title': location,
+            'transcript_text': text_content
+        }, None
+    except Exception as e:
+        return docx_file.name, None, str(e)
 
 
 def load_transcripts_from_docx(data_dir: str) -> List[Dict]:
     """Load transcripts from DOCX files in directory."""
     if not HAS_DOCX:
-        raise ImportError("python-docx is required to process DOCX files. Install with: pip install python-docx")
+        raise ImportError("lxml is required to process DOCX files. Install with: pip install lxml")
     
     data_path = Path(data_dir)
     if not data_path.exists():
@@ -138,122 +162,32 @@ def load_transcripts_from_docx(data_dir: str) -> List[Dict]:
     
     transcripts = []
     
-    # Reuse the parsing logic from convert_docx_to_json.py
-    def extract_date_from_filename(filename):
-        month_map = {
-            'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
-            'may': '05', 'jun': '06', 'jul': '07',
-            'aug': '08', 'august': '08',
-            'sep': '09', 'sept': '09', 'september': '09',
-            'oct': '10', 'october': '10',
-            'nov': '11', 'november': '11',
-            'dec': '12', 'december': '12'
-        }
-        date_pattern = r'(jan|feb|mar|apr|may|jun|jul|aug|august|sep|sept|september|oct|october|nov|november|dec|december)\s+(\d+)'
-        match = re.search(date_pattern, filename.lower())
-        if match:
-            month_abbr = match.group(1)
-            day = match.group(2).zfill(2)
-            month_num = month_map.get(month_abbr, '12')
-            return f"2025-{month_num}-{day}"
-        return "2025-01-01"
-    
-    def parse_filename_for_metadata(filename):
-        name_without_ext = filename.replace('.docx', '')
-        if name_without_ext.startswith(('Oct ', 'Sep ', 'Sept ', 'Aug ', 'Jul ', 'Jun ', 'May ', 'Apr ', 'Mar ', 'Feb ', 'Jan ', 'Dec ', 'Nov ')):
-            parts = name_without_ext.split(' - ', 1)
-            if len(parts) == 2:
-                date_part = parts[0]
-                name_part = parts[1]
-                name_parts = name_part.split('_')
-                if len(name_parts) >= 2:
-                    candidate = name_parts[0]
-                    location = '_'.join(name_parts[1:-1]) if len(name_parts) > 2 else name_parts[1]
-                    return candidate, location, date_part
-                else:
-                    if 'sherrill' in name_part.lower():
-                        candidate = 'Sherrill'
-                    elif 'ciattarelli' in name_part.lower():
-                        candidate = 'Ciattarelli'
-                    else:
-                        candidate = 'Unknown'
-                    location = name_part.replace(candidate, '').strip()
-                    return candidate, location, date_part
-        elif name_without_ext.startswith(('August ', 'September ', 'October ')):
-            parts = name_without_ext.split(' - ', 1)
-            if len(parts) == 2:
-                date_part = parts[0]
-                name_part = parts[1]
-                if 'sherrill' in name_part.lower():
-                    candidate = 'Sherrill'
-                elif 'ciattarelli' in name_part.lower():
-                    candidate = 'Ciattarelli'
-                else:
-                    candidate = 'Unknown'
-                location = name_part.replace(candidate, '').strip()
-                return candidate, location, date_part
-        
-        if 'sherrill' in filename.lower():
-            candidate = 'Sherrill'
-        elif 'ciattarelli' in filename.lower():
-            candidate = 'Ciattarelli'
-        else:
-            candidate = 'Unknown'
-        
-        date_match = re.search(r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+(\d+)', name_without_ext.lower())
-        if date_match:
-            date_part = f"{date_match.group(1).title()} {date_match.group(2)}"
-        else:
-            date_part = "Unknown"
-        
-        location = name_without_ext.replace(candidate, '').strip('_').strip('-').strip()
-        return candidate, location, date_part
-    
-    def extract_text_from_docx(file_path):
-        try:
-            doc = Document(file_path)
-            text_parts = []
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text_parts.append(paragraph.text.strip())
-            return "\n\n".join(text_parts)
-        except Exception as e:
-            print(f"Error reading {file_path}: {str(e)}")
-            return ""
-    
-    # Process all DOCX files
+    # Process all DOCX files across worker processes; map keeps the sorted order
     docx_files = [f for f in data_path.glob("*.docx") if not f.name.startswith("~$")]
     
-    for docx_file in sorted(docx_files):
-        try:
-            candidate, location, date = parse_filename_for_metadata(docx_file.name)
-            iso_date = extract_date_from_filename(date)
-            text_content = extract_text_from_docx(docx_file)
-            
-            transcripts.append({
-                'date': iso_date,
-                'candidate': candidate,
-                'location_or_title': location,
-                'transcript_text': text_content
-            })
-        except Exception as e:
-            print(f"Error processing {docx_file.name}: {str(e)}")
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = executor.map(_load_one, [str(f) for f in sorted(docx_files)], chunksize=4)
+        for name, transcript, err in results:
+            if err is not None:
+                print(f"Error processing {name}: {err}")
+            else:
+                transcripts.append(transcript)
     
     return transcripts
 
 
 def count_words(text: str) -> int:
     """Count words in text."""
-    text = clean_text(text)
-    words = [w.strip() for w in text.split() if w.strip()]
-    return len(words)
+    # split() with no arguments already drops empty strings, so its length is
+    # the word count without re-stripping every word
+    return len(clean_text(text).split())
 
 
 def generate_ngram_frequencies(
     transcripts: List[Dict],
     target_terms: Optional[List[str]] = None,
     min_frequency: int = 1
-) -> List[Dict]:
+) -> List[Tuple]:
     """Generate ngram frequency data grouped by week and candidate.
     
     Args:
@@ -262,10 +196,23 @@ def generate_ngram_frequencies(
         min_frequency: Minimum frequency to include a term
         
     Returns:
-        List of dictionaries with ngram frequency data
+        List of row tuples in FIELDNAMES order, sorted by week, candidate,
+        ngram type and term
     """
-    # Group transcripts by week and candidate
-    week_data = defaultdict(lambda: {'texts': [], 'total_words': 0})
+    # Lowercase the target terms once; ngrams are already lowercase from tokenize
+    if target_terms:
+        target_set = frozenset(t.lower() for t in target_terms)
+        target_tuple = tuple(target_set)
+    else:
+        target_set = None
+    
+    # Count ngrams per week and candidate, one transcript at a time, so the
+    # transcripts of a bucket are never concatenated into one large string
+    week_data = defaultdict(lambda: {
+        'counts': [Counter(), Counter(), Counter()],
+        'total_words': 0,
+        'tail': []
+    })
     
     for transcript in transcripts:
         date = transcript.get('date', '')
@@ -277,64 +224,63 @@ def generate_ngram_frequencies(
         
         week = get_week_start(date)
         key = (week, candidate)
+        data = week_data[key]
         
-        week_data[key]['texts'].append(text)
-    
-    # Calculate total words for each week/candidate
-    for key, data in week_data.items():
-        combined_text = ' '.join(data['texts'])
-        data['total_words'] = count_words(combined_text)
-    
-    # Extract ngrams and count frequencies
+        data['total_words'] += count_words(text)
+        
+        # Tokenize once, then count ngrams for 1, 2, and 3 grams. The last words
+        # of the bucket's previous transcript are carried over so ngrams that
+        # span two consecutive transcripts are still counted; only that short
+        # boundary window is built, never a copy of the whole word list.
+        words = tokenize(text)
+        tail = data['tail']
+        counts = data['counts']
+        for n in [1, 2, 3]:
+            counts[n - 1].update(extract_ngrams(words, n))
+            if n > 1 and tail:
+                boundary = tail[-(n - 1):] + words[:n - 1]
+                counts[n - 1].update(extract_ngrams(boundary, n))
+        data['tail'] = (tail + words[-2:])[-2:]
+    
+    # Filter and collect ngram frequencies. Buckets are visited in (week, candidate)
+    # order and terms are sorted within each ngram size, so the rows come out
+    # already in their final order without a sort over all of them.
     results = []
     
-    for (week, candidate), data in week_data.items():
-        combined_text = ' '.join(data['texts'])
+    for (week, candidate), data in sorted(week_data.items()):
         total_words = data['total_words']
         
         if total_words == 0:
             continue
         
-        # Extract ngrams for 1, 2, and 3 grams
         for n in [1, 2, 3]:
-            ngrams = extract_ngrams(combined_text, n)
-            ngram_counts = Counter(ngrams)
+            ngram_counts = data['counts'][n - 1]
             
             # Filter by target_terms if provided
-            if target_terms:
+            if target_set:
                 # For ngrams, check if any target term appears in the ngram
                 if n == 1:
                     # For 1-grams, check exact match
                     filtered_counts = {
                         term: count for term, count in ngram_counts.items()
-                        if term.lower() in [t.lower() for t in target_terms]
+                        if term in target_set
                     }
                 else:
                     # For multi-word ngrams, check if any target term appears
                     filtered_counts = {
                         term: count for term, count in ngram_counts.items()
-                        if any(t.lower() in term.lower() for t in target_terms)
+                        if any(t in term for t in target_tuple)
                     }
             else:
                 filtered_counts = ngram_counts
             
             # Add to results
-            for term, count in filtered_counts.items():
-                if count >= min_frequency:
-                    normalized_freq = (count / total_words) * 1000 if total_words > 0 else 0
-                    
-                    results.append({
-                        'week': week,
-                        'candidate': candidate,
-                        'term': term,
-                        'count': count,
-                        'total_words': total_words,
-                        'normalized_freq': normalized_freq,
-                        'ngram_type': f'{n}-gram'
-                    })
-    
-    # Sort results
-    results.sort(key=lambda x: (x['week'], x['candidate'], x['ngram_type'], x['term']))
+            ngram_type = f'{n}-gram'
+            results.extend(
+                (week, candidate, term, count, total_words, (count / total_words) * 1000, ngram_type)
+                for term, count in sorted(filtered_counts.items())
+                if count >= min_frequency
+            )
     
     return results
 
@@ -372,7 +318,7 @@ def main():
     parser.add_argument(
         '--use-docx',
         action='store_true',
-        help='Use DOCX files instead of JSON (requires python-docx)'
+        help='Use DOCX files instead of JSON (requires lxml)'
     )
     
     args = parser.parse_args()
@@ -413,16 +359,15 @@ def main():
     print(f"Writing to {args.output}...")
     with open(args.output, 'w', newline='', encoding='utf-8') as f:
         if results:
-            fieldnames = ['week', 'candidate', 'term', 'count', 'total_words', 'normalized_freq', 'ngram_type']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
+            writer = csv.writer(f)
+            writer.writerow(FIELDNAMES)
             writer.writerows(results)
     
     print(f"✅ Successfully wrote {len(results)} records to {args.output}")
     
     # Print summary
-    weeks = sorted(set(r['week'] for r in results))
-    candidates = sorted(set(r['candidate'] for r in results))
+    weeks = sorted(set(r[0] for r in results))
+    candidates = sorted(set(r[1] for r in results))
     
     print(f"\nSummary:")
     print(f"  Weeks: {len(weeks)} ({weeks[0]} to {weeks[-1]})")
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Shared JSON reading and writing, using orjson when it is installed.
+Used by docx_parser.py, convert_docx_to_json.py and generate_ngram_frequencies.py.
+"""
+
+import json
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def dumps_sorted(obj):
+    """Serialize obj to compact JSON bytes with sorted keys, as Flask's jsonify does."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True).encode('utf-8')
+
+def dump_file(obj, path):
+    """Write obj to path as UTF-8 JSON indented by 2 spaces."""
+    if HAS_ORJSON:
+        # Same bytes as json.dump(indent=2, ensure_ascii=False), serialized natively
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+
+def load_file(path):
+    """Read a JSON file."""
+    if HAS_ORJSON:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
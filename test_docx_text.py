@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Regression checks for the lxml DOCX paragraph reader in docx_text.py, against
+a small hand-built document.xml.
+"""
+
+import zipfile
+
+import pytest
+
+import docx_text
+
+_CONTENT_TYPES = (
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+
+_RELS = (
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+_DOCUMENT = (
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:v="urn:schemas-microsoft-com:vml"><w:body>'
+    # Text box in the middle of a paragraph; its own paragraph must not leak in
+    # or reset the text collected so far
+    '<w:p><w:r><w:t xml:space="preserve">Before box. </w:t></w:r>'
+    '<w:r><w:pict><v:shape><v:textbox><w:txbxContent>'
+    '<w:p><w:r><w:t>Inside box.</w:t></w:r></w:p>'
+    '</w:txbxContent></v:textbox></v:shape></w:pict></w:r>'
+    '<w:r><w:t>After box.</w:t></w:r></w:p>'
+    # Special run characters; page breaks have no text
+    '<w:p><w:r><w:t>co</w:t><w:noBreakHyphen/><w:t>op</w:t><w:ptab/><w:t>a</w:t>'
+    '<w:tab/><w:t>b</w:t><w:br/><w:t>c</w:t><w:cr/><w:t>d</w:t>'
+    '<w:br w:type="page"/><w:t>e</w:t></w:r></w:p>'
+    # Tab stops in paragraph properties are not text
+    '<w:p><w:pPr><w:tabs><w:tab w:val="left" w:pos="720"/></w:tabs></w:pPr>'
+    '<w:r><w:t>Tab stops</w:t></w:r></w:p>'
+    # Hyperlink runs count; runs inside w:ins and w:fldSimple do not
+    '<w:p><w:r><w:t xml:space="preserve">Visit </w:t></w:r>'
+    '<w:hyperlink><w:r><w:t>site</w:t></w:r></w:hyperlink>'
+    '<w:ins><w:r><w:t>inserted</w:t></w:r></w:ins>'
+    '<w:fldSimple><w:r><w:t>field</w:t></w:r></w:fldSimple>'
+    '<w:r><w:t>.</w:t></w:r></w:p>'
+    # Table paragraphs are not body paragraphs
+    '<w:tbl><w:tr><w:tc><w:p><w:r><w:t>Cell</w:t></w:r></w:p></w:tc></w:tr></w:tbl>'
+    '<w:p/>'
+    '<w:p><w:r><w:t>Last</w:t></w:r></w:p>'
+    '</w:body></w:document>'
+)
+
+_EXPECTED = [
+    'Before box. After box.',
+    'co-op\ta\tb\nc\nde',
+    'Tab stops',
+    'Visit site.',
+    '',
+    'Last',
+]
+
+@pytest.fixture
+def sample_docx(tmp_path):
+    path = tmp_path / 'sample.docx'
+    with zipfile.ZipFile(path, 'w') as z:
+        z.writestr('[Content_Types].xml', _CONTENT_TYPES)
+        z.writestr('_rels/.rels', _RELS)
+        z.writestr('word/document.xml', _DOCUMENT)
+    return path
+
+def test_iter_docx_paragraphs(sample_docx):
+    assert list(docx_text.iter_docx_paragraphs(sample_docx)) == _EXPECTED
+
+def test_matches_python_docx(sample_docx):
+    docx = pytest.importorskip('docx')
+    expected = [p.text for p in docx.Document(str(sample_docx)).paragraphs]
+    assert list(docx_text.iter_docx_paragraphs(sample_docx)) == expected
+
+def test_extract_text_from_docx(sample_docx):
+    assert docx_text.extract_text_from_docx(sample_docx) == '\n\n'.join(
+        p.strip() for p in _EXPECTED if p.strip()
+    )
+
+def test_extract_text_from_docx_raises_on_corrupt_file(tmp_path):
+    path = tmp_path / 'corrupt.docx'
+    path.write_bytes(b'not a zip')
+    with pytest.raises(zipfile.BadZipFile):
+        docx_text.extract_text_from_docx(path)
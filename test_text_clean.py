@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Regression checks for the single-pass cleaners in text_clean.py. URLs and
+[...]/(...) artifacts are removed in one left-to-right scan, so where they
+overlap the results differ from the old URL-first sequence of passes.
+"""
+
+import pytest
+
+import text_clean
+
+@pytest.mark.parametrize('text, expected', [
+    ('a [laughter] b (inaudible) c', 'a  b  c'),
+    ('it&#39;s &quot;fine&quot; &amp; good', 'it\'s "fine" & good'),
+    ('watch https://youtu.be/abcdefghijk now', 'watch  now'),
+    # The URL used to be removed first, leaving an unclosed "(" or "["
+    ('(see https://youtu.be/abcdefghijk) more', 'more'),
+    ('[https://youtu.be/x] y', 'y'),
+    # Brackets used to be removed before parentheses
+    ('(a [b) c]', 'c]'),
+])
+def test_clean_text(text, expected):
+    assert text_clean.clean_text(text) == expected
+
+@pytest.mark.parametrize('text, expected', [
+    ('a [laughter]\n\nb (inaudible) c', 'a  b  c'),
+    ('watch https://www.youtube.com/watch?v=abcdefghijk now', 'watch now'),
+    ('(see https://youtu.be/abcdefghijk) more', 'more'),
+    ('a &lt; b &gt; c', 'a < b > c'),
+    # Double-escaped brackets decode fully, as with the old replace chain
+    ('a &amp;lt; b &amp;gt; c', 'a < b > c'),
+    ('a &amp;amp;lt; b', 'a &amp;lt; b'),
+])
+def test_clean_text_for_analysis(text, expected):
+    assert text_clean.clean_text_for_analysis(text) == expected
+
+def test_extract_youtube_url():
+    assert text_clean.extract_youtube_url('x https://youtu.be/abcdefghijk y') == (
+        'https://youtu.be/abcdefghijk', 'abcdefghijk'
+    )
+    assert text_clean.extract_youtube_url('no link') == ('', '')
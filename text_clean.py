@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Shared transcript text cleaning and YouTube URL extraction.
+Used by docx_parser.py, convert_docx_to_json.py and generate_ngram_frequencies.py.
+
+The JSON/API pipeline and the ngram script strip slightly different things, so
+each keeps its own fused pattern, but both are compiled once, here.
+"""
+
+import re
+
+# YouTube URL forms in priority order; group 1 is the video ID
+_YT_PATTERNS = tuple(re.compile(p) for p in (
+    r'https?://(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})',
+    r'https?://youtu\.be/([a-zA-Z0-9_-]{11})',
+    r'https?://(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})',
+    r'https?://(?:www\.)?youtube\.com/v/([a-zA-Z0-9_-]{11})'
+))
+_WS_RE = re.compile(r'\s+')
+
+# HTML entities left behind by the transcript downloader. The old one-replace-per-
+# entity chain decoded &amp; before &lt;/&gt;, so double-escaped brackets came out
+# as plain < and >; a single pass needs them listed explicitly to do the same.
+_ENTITIES = {'&#39;': "'", '&quot;': '"', '&amp;': '&', '&lt;': '<', '&gt;': '>',
+             '&amp;lt;': '<', '&amp;gt;': '>'}
+
+# Every clean_text_for_analysis step fused into one alternation, so the text is
+# scanned once. Groups: 1 YouTube URLs with the whitespace around them,
+# 2 [laughter]-style artifacts, 3 (inaudible)-style artifacts, 4 HTML entities,
+# 5 whitespace runs. URLs and artifacts are removed in the same left-to-right scan,
+# so whichever starts first wins: "(see <URL>) more" loses the whole parenthesis.
+_ANALYSIS_RE = re.compile(
+    r'((?:\s*https?://(?:(?:www\.)?youtube\.com/(?:watch\?v=|embed/|v/)|youtu\.be/)[a-zA-Z0-9_-]{11})+\s*)'
+    r'|(\[[^\]]*\])'
+    r'|(\([^)]*\))'
+    r'|(&#39;|&quot;|&amp;lt;|&amp;gt;|&amp;|&lt;|&gt;)'
+    r'|(\s+)'
+)
+
+# Every clean_text step fused into one alternation, with the same groups except
+# that group 1 is a whole YouTube URL token and artifacts stop at a newline
+_NGRAM_RE = re.compile(
+    r'(https?://(?:(?:www\.)?youtube\.com/(?:watch\?v=|embed/)|youtu\.be/)[^\s]+)'
+    r'|(\[[^\]\n]*\])'
+    r'|(\([^)\n]*\))'
+    r'|(&#39;|&quot;|&amp;)'
+    r'|(\s+)'
+)
+
+def _analysis_sub(match):
+    """Replacement for one _ANALYSIS_RE match."""
+    group = match.lastindex
+    if group == 1:
+        # Removed URLs leave a single space if they were separated by whitespace
+        return ' ' if _WS_RE.search(match.group(1)) else ''
+    if group == 4:
+        return _ENTITIES[match.group(4)]
+    if group == 5:
+        return ' '
+    return ''
+
+def _ngram_sub(match):
+    """Replacement for one _NGRAM_RE match."""
+    group = match.lastindex
+    if group == 4:
+        return _ENTITIES[match.group(4)]
+    if group == 5:
+        return ' '
+    return ''
+
+def extract_youtube_url(text):
+    """
+    Extract the first YouTube URL from text if present.
+    Returns (url, video_id); both are empty strings if no URL was found.
+    """
+    if not text:
+        return "", ""
+    
+    for pattern in _YT_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return match.group(0), match.group(1)
+    
+    return "", ""
+
+def clean_text_for_analysis(text):
+    """Clean text for better analysis."""
+    if not text:
+        return ""
+    
+    # Remove YouTube URLs, [laughter]/(inaudible) artifacts and HTML entities,
+    # and collapse whitespace, all in a single pass
+    return _ANALYSIS_RE.sub(_analysis_sub, text).strip()
+
+def clean_text(text):
+    """
+    Clean text for ngram extraction.
+    Removes YouTube URLs and [laughter]/(inaudible) artifacts, decodes HTML
+    entities and normalizes whitespace in a single pass. Removed artifacts can
+    leave doubled spaces, which tokenizing with split() ignores.
+    """
+    if not text:
+        return ""
+    
+    return _NGRAM_RE.sub(_ngram_sub, text).strip()